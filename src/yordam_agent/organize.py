@@ -119,6 +119,13 @@ _PERSON_NAME_STOPWORDS = {
     "icindir",
 }
 
+_PERSON_CONTEXT_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(keyword) for keyword in _PERSON_CONTEXT_KEYWORDS) + r")\b"
+)
+_NAME_TOKEN_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_FILENAME_SEPARATOR_RE = re.compile(r"[_\-.]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 @dataclass
 class FileMeta:
@@ -384,12 +391,7 @@ def _normalize_match_text(value: str) -> str:
 
 
 def _context_mentions_person(context: str) -> bool:
-    normalized = _normalize_match_text(context)
-    for keyword in _PERSON_CONTEXT_KEYWORDS:
-        pattern = r"\b" + re.escape(keyword) + r"\b"
-        if re.search(pattern, normalized):
-            return True
-    return False
+    return _PERSON_CONTEXT_RE.search(_normalize_match_text(context)) is not None
 
 
 def _spotlight_value(path: Path, attribute: str) -> List[str]:
@@ -420,7 +422,7 @@ def _spotlight_value(path: Path, attribute: str) -> List[str]:
 def _extract_person_from_text(text: str) -> Optional[str]:
     if not text:
         return None
-    tokens = re.findall(r"[^\W\d_]+", text, flags=re.UNICODE)
+    tokens = _NAME_TOKEN_RE.findall(text)
     if not tokens:
         return None
 
@@ -457,8 +459,8 @@ def _extract_person_from_text(text: str) -> Optional[str]:
 
 def _extract_person_from_filename(name: str) -> Optional[str]:
     base = Path(name).stem
-    cleaned = re.sub(r"[_\-.]+", " ", base)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = _FILENAME_SEPARATOR_RE.sub(" ", base)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
     if not cleaned:
         return None
     return _extract_person_from_text(cleaned)
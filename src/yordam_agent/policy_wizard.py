@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .policy import DEFAULT_POLICY
 
+_KEY_VALUE_PAIR_RE = re.compile(r"([^,=]*)=([^,]*)")
+
 
 def _parse_override_value(raw: str) -> object:
     raw = raw.strip()
@@ -27,11 +30,7 @@ def _parse_key_value_list(raw: str) -> Dict[str, object]:
     result: Dict[str, object] = {}
     if not raw:
         return result
-    pairs = [chunk.strip() for chunk in raw.split(",") if chunk.strip()]
-    for pair in pairs:
-        if "=" not in pair:
-            continue
-        key, value = pair.split("=", 1)
+    for key, value in _KEY_VALUE_PAIR_RE.findall(raw):
         key = key.strip()
         value = value.strip()
         if not key or not value:
@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Tests that create files on disk live in *FsTests classes; deselect with `-m "not io"`.
+    for item in items:
+        cls = getattr(item, "cls", None)
+        if cls is not None and cls.__name__.endswith("FsTests"):
+            item.add_marker(pytest.mark.io)
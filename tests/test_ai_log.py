@@ -1,12 +1,9 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
-from yordam_agent.ai_log import (  # noqa: E402
+from yordam_agent.ai_log import (
     append_ai_log,
     build_log_entry,
     resolve_log_path,
@@ -14,14 +11,6 @@ from yordam_agent.ai_log import (  # noqa: E402
 
 
 class AiLogTests(unittest.TestCase):
-    def test_resolve_log_path_relative(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            resolved = resolve_log_path(".yordam-agent/ai-interactions.jsonl", root)
-            self.assertEqual(
-                resolved, root / ".yordam-agent" / "ai-interactions.jsonl"
-            )
-
     def test_resolve_log_path_empty(self) -> None:
         self.assertIsNone(resolve_log_path("", Path("/tmp")))
 
@@ -42,6 +31,16 @@ class AiLogTests(unittest.TestCase):
         self.assertIn("source", entry["context"])
         self.assertNotIn("prompt", entry["context"])
 
+
+class AiLogFsTests(unittest.TestCase):
+    def test_resolve_log_path_relative(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            resolved = resolve_log_path(".yordam-agent/ai-interactions.jsonl", root)
+            self.assertEqual(
+                resolved, root / ".yordam-agent" / "ai-interactions.jsonl"
+            )
+
     def test_append_ai_log_writes_jsonl(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             log_path = Path(tmp) / ".yordam-agent" / "ai-interactions.jsonl"
@@ -61,7 +60,3 @@ class AiLogTests(unittest.TestCase):
             self.assertEqual(len(lines), 1)
             parsed = json.loads(lines[0])
             self.assertEqual(parsed["event"], "ollama.generate")
-
-
-if __name__ == "__main__":
-    unittest.main()
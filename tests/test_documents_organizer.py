@@ -1,10 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
-from yordam_agent.documents_organizer import (  # noqa: E402
+from yordam_agent.documents_organizer import (
     match_extension,
     match_keyword,
     parse_ai_response,
@@ -47,7 +43,3 @@ class DocumentsOrganizerTests(unittest.TestCase):
         folder, found = resolve_existing_folder("projects", ["Projects", "Personal"])
         self.assertEqual(folder, "Projects")
         self.assertTrue(found)
-
-
-if __name__ == "__main__":
-    unittest.main()
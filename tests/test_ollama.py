@@ -1,40 +1,27 @@
-import sys
+import io
 import unittest
 import urllib.error
-from pathlib import Path
 from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from yordam_agent.ollama import OllamaClient
 
-from yordam_agent.ollama import OllamaClient  # noqa: E402
+_OK_PAYLOAD = b'{"response": "ok"}'
 
-
-class _FakeResponse:
-    def __init__(self, payload: str) -> None:
-        self._payload = payload
-
-    def read(self) -> bytes:
-        return self._payload.encode("utf-8")
-
-    def __enter__(self) -> "_FakeResponse":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> bool:
-        return False
+_CLIENT = OllamaClient("http://localhost:11434", fallback_model="gpt-oss:20b")
 
 
 class OllamaFallbackTests(unittest.TestCase):
-    def test_generate_uses_fallback_model(self) -> None:
-        client = OllamaClient("http://localhost:11434", fallback_model="gpt-oss:20b")
-        with mock.patch("yordam_agent.ollama.urllib.request.urlopen") as mocked:
-            mocked.side_effect = [
-                urllib.error.URLError("boom"),
-                _FakeResponse('{"response": "ok"}'),
-            ]
-            result = client.generate(model="deepseek-r1:8b", prompt="hi")
-            self.assertEqual(result, "ok")
-            self.assertEqual(mocked.call_count, 2)
+    @classmethod
+    def setUpClass(cls) -> None:
+        patcher = mock.patch("yordam_agent.ollama.urllib.request.urlopen")
+        cls.urlopen = patcher.start()
+        cls.addClassCleanup(patcher.stop)
 
+    def setUp(self) -> None:
+        self.urlopen.reset_mock(side_effect=True)
 
-if __name__ == "__main__":
-    unittest.main()
+    def test_generate_uses_fallback_model(self) -> None:
+        self.urlopen.side_effect = iter([urllib.error.URLError("boom"), io.BytesIO(_OK_PAYLOAD)])
+        result = _CLIENT.generate(model="deepseek-r1:8b", prompt="hi")
+        self.assertEqual(result, "ok")
+        self.assertEqual(self.urlopen.call_count, 2)
@@ -1,10 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
-from yordam_agent.policy_wizard import (  # noqa: E402
+from yordam_agent.policy_wizard import (
     parse_extension_overrides,
     parse_type_overrides,
 )
@@ -21,6 +17,6 @@ class PolicyWizardParseTests(unittest.TestCase):
         self.assertEqual(parsed["Image"], "Images")
         self.assertEqual(parsed["Video"], "Media")
 
-
-if __name__ == "__main__":
-    unittest.main()
+    def test_parse_type_overrides_skips_malformed_pairs(self) -> None:
+        parsed = parse_type_overrides("Image, =Media, Video=, Text = Notes , Data=a=b")
+        self.assertEqual(parsed, {"Text": "Notes", "Data": "a=b"})
@@ -1,11 +1,8 @@
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
-from yordam_agent.rename import (  # noqa: E402
+from yordam_agent.rename import (
     RenameOp,
     _normalize_target_name,
     _resolve_name_collision,
@@ -34,18 +31,18 @@ class RenameTests(unittest.TestCase):
         resolved = _resolve_name_collision("Report.pdf", reserved)
         self.assertEqual(resolved, "Report__2.pdf")
 
+
+class RenameFsTests(unittest.TestCase):
     def test_apply_renames_handles_swap(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
             a = root / "a.txt"
             b = root / "b.txt"
-            a.write_text("A", encoding="utf-8")
-            b.write_text("B", encoding="utf-8")
+            a.touch()
+            b.touch()
+            a_ino = a.stat().st_ino
+            b_ino = b.stat().st_ino
             ops = [RenameOp(src=a, dst=b), RenameOp(src=b, dst=a)]
             apply_renames(ops)
-            self.assertEqual((root / "a.txt").read_text(encoding="utf-8"), "B")
-            self.assertEqual((root / "b.txt").read_text(encoding="utf-8"), "A")
-
-
-if __name__ == "__main__":
-    unittest.main()
+            self.assertEqual((root / "a.txt").stat().st_ino, b_ino)
+            self.assertEqual((root / "b.txt").stat().st_ino, a_ino)